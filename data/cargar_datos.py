@@ -9,32 +9,52 @@ Genera datos con las siguientes características:
  4. Campos no categorizados (texto aleatorio libre).
 
 Genera exactamente 1000 filas en cada tabla: sede, docente, clase, matricula, alumno,
-clase_has_sede (intentos hasta llenar o hasta que ya no haya combinaciones nuevas),
+clase_has_sede (pares únicos, o todas las combinaciones si hay menos de 1000),
 pago (1000 registros) y asistencia (1000 registros).
 
 Notas importantes:
  - El script intenta ejecutar ALTER TABLE para permitir NULLs y ajustar DECIMAL. Requiere
    privilegios ALTER. Si no tienes permisos, el script continuará sin alterar y
    generará datos sin NULLs en esas columnas.
- - Se respeta la integridad referencial: se insertan sedes/docentes/clases/matriculas/alumnos
-   primero, y luego pagos/asistencias.
- - Para mejorar rendimiento se hace commit cada bloque de inserciones.
+ - Se respeta la integridad referencial: las tablas se cargan en paralelo por niveles,
+   cada una con su propia conexión: sedes/docentes/matriculas, luego clases/alumnos y
+   por último clase_has_sede/pagos/asistencias.
+ - Para mejorar rendimiento se inserta por bloques (BATCH filas por sentencia INSERT
+   multi-fila) y se hace un solo commit por tabla, con unique_checks y
+   foreign_key_checks desactivados durante la carga. Los índices secundarios se
+   mantienen: todas las tablas son InnoDB, que no admite DISABLE KEYS. Los ids de
+   cada bloque se calculan a partir de cursor.lastrowid y cursor.rowcount, lo que
+   supone que el script es el único que escribe en estas tablas durante la carga
+   (no ejecutar otros INSERT en paralelo).
+ - pago y asistencia se cargan con LOAD DATA LOCAL INFILE (requiere local_infile=ON
+   en el servidor); el cliente solo permite enviar archivos del directorio temporal
+   (allow_local_infile_in_path). Si no está permitido se usa un INSERT multi-fila.
+ - Si hay privilegios, cada conexión de carga desactiva el binlog de su sesión
+   (sql_log_bin=0) y se avisa al iniciar; si no, se carga con binlog. No se modifica
+   ninguna variable global del servidor.
 
 Requisitos:
-    pip install mysql-connector-python
+    pip install mysql-connector-python numpy
+
+    El script usa la extensión C del conector (incluida en las ruedas binarias); si no
+    está disponible, avisa y continúa en Python puro.
 
 Ejecución:
     python bulk_insert_1000.py
 
 """
 
-import random
 import string
-from datetime import datetime, timedelta
+from datetime import datetime
 import getpass
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import mysql.connector # type: ignore
 from mysql.connector import Error # type: ignore
 from decimal import Decimal
+import numpy as np
 
 # ---------- Config (se piden al ejecutar) ----------
 user = input("Usuario MySQL (ej. root): ").strip() or "root"
@@ -48,23 +68,201 @@ database = input("Base de datos (por defecto 'mydb'): ").strip() or "mydb"
 N = 1000  # registros objetivo por tabla
 NULL_RATIO = 0.10  # ~10% valores nulos donde se permite
 LOW_VARIANCE_RATIO = 0.70  # 70% usan el mismo valor en columnas de baja varianza
-BATCH = 200  # commits cada BATCH inserciones para no saturar
+BATCH = 10000  # filas por sentencia INSERT (con N=1000, un solo INSERT por tabla)
+
+# Variables de sesión de cada conexión de carga (se descartan al cerrarla); un solo SET
+# con varias asignaciones, así es un único round-trip
+LOAD_SESSION = "SET autocommit=0, unique_checks=0, foreign_key_checks=0"
+# Binlog desactivado en cada conexión de carga; requiere privilegios (SUPER o
+# SYSTEM_VARIABLES_ADMIN) y solo se aplica si funcionó en la conexión principal
+BINLOG_OFF = "SET SESSION sql_log_bin=0"
+
+# Generador aleatorio de NumPy: los valores de cada tabla se sortean de una vez
+rng = np.random.default_rng()
+NOW = np.datetime64(datetime.now(), 's')  # referencia única para todas las fechas
+ALPHABET = np.frombuffer((string.ascii_letters + ' ').encode(), dtype=np.uint8)
+TEXT_POOL_SIZE = 4096  # textos aleatorios precalculados por cada rango de longitud
+# Errores de LOAD DATA LOCAL rechazado: ER_NOT_ALLOWED_COMMAND (1148),
+# CR_LOAD_DATA_LOCAL_INFILE_REJECTED (2068) y ER_CLIENT_LOCAL_FILES_DISABLED (3948)
+LOCAL_INFILE_REFUSED = {1148, 2068, 3948}
 
 # ---------- Helpers ----------
 
-def rand_text(min_len=5, max_len=25):
-    l = random.randint(min_len, max_len)
-    return ''.join(random.choices(string.ascii_letters + ' ', k=l)).strip()
+def text_pool(min_len, max_len, size=TEXT_POOL_SIZE):
+    """Tabla de `size` textos aleatorios; las filas eligen de aquí en vez de generar texto.
+
+    Todos los caracteres se sortean en un único buffer de bytes que se decodifica una
+    sola vez; cada texto es un corte de ese buffer.
+    """
+    ends = np.cumsum(rng.integers(min_len, max_len + 1, size)).tolist()
+    buf = ALPHABET[rng.integers(0, ALPHABET.size, ends[-1])].tobytes().decode('ascii')
+    return [buf[start:end].strip() for start, end in zip([0] + ends[:-1], ends)]
+
+
+def mask(ratio, n):
+    """Arreglo de n booleanos, cada uno True con probabilidad `ratio`."""
+    return rng.random(n) < ratio
+
+
+def pick(values, n):
+    """Arreglo (dtype=object) de n elementos de `values` elegidos al azar."""
+    return np.asarray(values, dtype=object)[rng.integers(0, len(values), n)]
+
+
+def pick_ids(ids, n):
+    """Arreglo de n ids (int64) elegidos al azar de `ids`, con un único gather en C."""
+    return ids[rng.integers(0, ids.size, n)]
+
+
+def nullable(values, ratio=NULL_RATIO):
+    """Reemplaza por None aproximadamente `ratio` de los valores."""
+    return np.where(mask(ratio, len(values)), None, values)
+
+
+def decimals(low, high, n):
+    """Arreglo de n importes Decimal con dos decimales, uniformes en [low, high).
+
+    Se sortean como centavos enteros y cada Decimal se arma con scaleb(-2), sin pasar
+    por float ni str (exacto para DECIMAL(10,2)).
+    """
+    cents = rng.integers(low * 100, high * 100, n).tolist()
+    return np.array([Decimal(c).scaleb(-2) for c in cents], dtype=object)
+
+
+def rows_of(*columns):
+    """Une columnas (arreglos de NumPy) en la lista de tuplas que recibe el conector."""
+    return list(zip(*(c.tolist() for c in columns)))
+
+
+def random_dates(n, start_days_ago=365*2, end_days_ago=0):
+    """n fechas al azar entre start_days_ago y end_days_ago días atrás.
+
+    Se calculan como segundos enteros respecto a NOW y se devuelven como arreglo
+    datetime64[s]; rows_of() los convierte en objetos datetime (con .tolist()) para
+    que el conector los envíe sin pasar por strftime.
+    """
+    span = (start_days_ago - end_days_ago) * 86400
+    offsets = end_days_ago * 86400 + (rng.random(n) * span).astype(np.int64)
+    return NOW - offsets.astype('timedelta64[s]')
+
+
+def multi_insert(cursor, table, columns, rows, skip_duplicates=False):
+    """Ejecuta un único INSERT ... VALUES (...),(...) con todas las filas de `rows`.
+
+    Se arma la sentencia a mano en vez de depender de que executemany la reescriba,
+    así cada lote es siempre un solo round-trip al servidor. Con `skip_duplicates`
+    las filas que ya existen se ignoran en el servidor (ON DUPLICATE KEY UPDATE sin
+    cambios) en lugar de fallar.
+    """
+    placeholders = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    sql = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+           + ", ".join([placeholders] * len(rows)))
+    if skip_duplicates:
+        sql += f" ON DUPLICATE KEY UPDATE {columns[0]} = {columns[0]}"
+    cursor.execute(sql, [v for row in rows for v in row])
+
+
+def tsv_value(value):
+    """Formatea un valor para LOAD DATA (tabulador como separador, \\N como NULL)."""
+    if value is None:
+        return r'\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def load_data(cursor, table, columns, rows):
+    """Carga `rows` con LOAD DATA LOCAL INFILE a partir de un archivo TSV temporal.
+
+    Es la vía de ingesta más rápida de MySQL porque el servidor no analiza un INSERT
+    por fila. Solo si el servidor o el cliente rechazan local_infile se recurre a
+    multi_insert; cualquier otro error (p. ej. avisos de datos elevados por
+    raise_on_warnings, con las filas ya cargadas) se propaga para no duplicarlas.
+    """
+    with tempfile.NamedTemporaryFile('w', suffix='.tsv', delete=False,
+                                     encoding='utf-8', newline='\n') as f:
+        for row in rows:
+            f.write('\t'.join(tsv_value(v) for v in row) + '\n')
+    try:
+        cursor.execute(f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} CHARACTER SET utf8mb4 "
+                       f"FIELDS TERMINATED BY '\\t' ({', '.join(columns)})", (f.name,))
+    except Error as e:
+        if e.errno not in LOCAL_INFILE_REFUSED:
+            raise
+        multi_insert(cursor, table, columns, rows)
+    finally:
+        os.remove(f.name)
+
+
+def insert_batch(cursor, table, columns, rows):
+    """Inserta `rows` en una sola sentencia y devuelve los ids AUTO_INCREMENT asignados.
+
+    cursor.lastrowid es el id de la primera fila y cursor.rowcount el número de filas.
+    Los ids de un INSERT multi-fila son contiguos mientras nadie más inserte en la
+    misma tabla a la vez (incluso con innodb_autoinc_lock_mode=2); cada tabla la carga
+    una sola conexión, así que basta con no escribir en ellas durante la carga.
+    """
+    multi_insert(cursor, table, columns, rows)
+    first_id = cursor.lastrowid
+    return list(range(first_id, first_id + cursor.rowcount))
+
+
+def insert_rows(cursor, table, columns, rows):
+    """Inserta `rows` en bloques de BATCH filas y devuelve todos los ids asignados."""
+    ids = []
+    for start in range(0, len(rows), BATCH):
+        ids.extend(insert_batch(cursor, table, columns, rows[start:start + BATCH]))
+    return ids
+
+# Textos libres (no categorizados) de cada columna, generados una sola vez
+SEDE_TEXTS = text_pool(4, 10)
+CLASE_TEXTS = text_pool(6, 18)
+PERIODO_TEXTS = text_pool(4, 7)
+
+# ---------- Generación de filas ----------
+# Cada tabla se genera columna a columna sobre arreglos ya sorteados (np.where en vez
+# de if/else por fila); las tuplas se arman una sola vez al final.
+
+def build_sede_rows(n):
+    nombres = np.where(mask(LOW_VARIANCE_RATIO, n), "Sede Principal", "Sede " + pick(SEDE_TEXTS, n))
+    ubicaciones = nullable("Ciudad " + pick(['A','B','C','D','E'], n))
+    return rows_of(nombres, ubicaciones)
+
 
+def build_docente_rows(n):
+    nombres = (pick(['Ana','Juan','Luis','Marta','Carolina','Pedro'], n) + " "
+               + pick(['Gómez','Pérez','López','Torres','Ruiz'], n))
+    nombres = np.where(mask(LOW_VARIANCE_RATIO, n), "Profesor Común", nombres)
+    return rows_of(nullable(nombres))
 
-def maybe_null(value):
-    return None if random.random() < NULL_RATIO else value
 
+def build_clase_rows(n, docente_ids):
+    deportes = ["Voleibol", "Fútbol", "Baloncesto"]
+    # Deporte en la mayoría de filas, texto aleatorio sin categorizar en el resto
+    nombres = np.where(mask(LOW_VARIANCE_RATIO, n), pick(deportes, n), pick(CLASE_TEXTS, n))
+    return rows_of(nullable(nombres), pick_ids(docente_ids, n))
+
+
+def build_matricula_rows(n):
+    costos = np.where(mask(LOW_VARIANCE_RATIO, n), Decimal('100000.00'), decimals(50000, 300000, n))
+    return rows_of(nullable(costos), random_dates(n, 365*2, 0))
+
+
+def build_alumno_rows(n, matricula_ids, sede_ids):
+    nombres = (pick(['Andrés','Lucía','Diego','Sofía','Camila','Miguel'], n) + " "
+               + pick(['Gómez','Pérez','López','Torres'], n))
+    nombres = np.where(mask(LOW_VARIANCE_RATIO, n), "Estudiante Test", nombres)
+    return rows_of(nullable(nombres), pick_ids(matricula_ids, n), pick_ids(sede_ids, n))
 
-def random_date(start_days_ago=365*2, end_days_ago=0):
-    start = datetime.now() - timedelta(days=start_days_ago)
-    end = datetime.now() - timedelta(days=end_days_ago)
-    return start + (end - start) * random.random()
+
+def build_pago_rows(n, alumno_ids):
+    periods = ['2025-01','2025-02','2025-03','2025-04', '2025-05']
+    valores = np.where(mask(LOW_VARIANCE_RATIO, n), Decimal('50000.00'), decimals(20000, 150000, n))
+    periodos = np.where(mask(0.85, n), pick(periods, n), pick(PERIODO_TEXTS, n))
+    return rows_of(random_dates(n, 365, 0), nullable(valores), nullable(periodos), pick_ids(alumno_ids, n))
+
+
+def build_asistencia_rows(n, alumno_ids, clase_ids, sede_ids):
+    return rows_of(random_dates(n, 90, 0), pick_ids(alumno_ids, n),
+                   pick_ids(clase_ids, n), pick_ids(sede_ids, n))
 
 # ---------- Conexión ----------
 config = {
@@ -73,11 +271,77 @@ config = {
     'host': host,
     'port': port,
     'database': database,
-    'raise_on_warnings': True
+    'raise_on_warnings': True,
+    'use_pure': False,  # extensión C (libmysqlclient) para serializar parámetros
+    # LOAD DATA LOCAL INFILE para pago y asistencia, limitado a los TSV temporales
+    'allow_local_infile_in_path': tempfile.gettempdir()
 }
+if not mysql.connector.HAVE_CEXT:
+    # Desde la 9.x, use_pure=False sin extensión C lanza ImportError al conectar
+    print("Aviso: la extensión C de mysql-connector-python (_mysql_connector) no está "
+          "disponible; se usará la implementación en Python puro, más lenta.")
+    config['use_pure'] = True
+
+# ---------- Carga por tabla ----------
+# Cada tarea abre su propia conexión (no se comparten entre hilos), con LOAD_SESSION
+# aplicado y un solo commit al terminar la tabla.
+
+@contextmanager
+def load_session():
+    """Conexión de carga propia; entrega su cursor y hace commit si no hubo errores."""
+    conn = mysql.connector.connect(**config)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(LOAD_SESSION)
+        if skip_binlog:
+            cursor.execute(BINLOG_OFF)
+        try:
+            yield cursor
+            conn.commit()
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
+
+
+def load_table(table, columns, rows):
+    """Inserta `rows` en `table` y devuelve los ids AUTO_INCREMENT asignados (arreglo int64)."""
+    with load_session() as cursor:
+        ids = insert_rows(cursor, table, columns, rows)
+    return np.asarray(ids, dtype=np.int64)
+
+
+def load_clase_has_sede(clase_ids, sede_ids):
+    """Inserta hasta N pares (clase, sede) distintos y devuelve cuántos insertó."""
+    # Los pares se deduplican en Python: no se envían INSERTs que violen la PK
+    pares = set()
+    max_pares = min(N, clase_ids.size * sede_ids.size)  # evita loop infinito
+    while len(pares) < max_pares:
+        faltan = max_pares - len(pares)  # se sortean todos los pares que faltan de una vez
+        pares.update(zip(pick_ids(clase_ids, faltan).tolist(), pick_ids(sede_ids, faltan).tolist()))
+    pares = list(pares)
+    insertadas = 0
+    with load_session() as cursor:
+        for start in range(0, len(pares), BATCH):
+            # Cada clase_id es nuevo en esta ejecución, así que no se esperan duplicados;
+            # si los hubiera no fallan y rowcount los cuenta como 0 (fila sin cambios)
+            multi_insert(cursor, 'clase_has_sede', ('clase_id', 'sede_id'), pares[start:start + BATCH],
+                         skip_duplicates=True)
+            insertadas += cursor.rowcount
+    return insertadas
+
+
+def load_file(table, columns, rows):
+    """Carga `rows` en `table` con LOAD DATA por bloques de BATCH y devuelve cuántas filas cargó."""
+    with load_session() as cursor:
+        for start in range(0, len(rows), BATCH):
+            load_data(cursor, table, columns, rows[start:start + BATCH])
+    return len(rows)
+
 
 conn = None
 cursor = None
+skip_binlog = False  # BINLOG_OFF se pudo aplicar (se comprueba antes de cargar)
 
 try:
     conn = mysql.connector.connect(**config)
@@ -86,16 +350,15 @@ try:
           f"\nInsertando {N} registros por tabla. Esto puede tardar unos minutos...")
 
     # Intentar cambiar esquema para aceptar NULLs y decimal
+    # (un solo ALTER por tabla: varios MODIFY en la misma sentencia)
     alters = [
-        "ALTER TABLE sede MODIFY nombre_sede VARCHAR(100) NULL",
-        "ALTER TABLE sede MODIFY ubicacion VARCHAR(45) NULL",
+        "ALTER TABLE sede MODIFY nombre_sede VARCHAR(100) NULL, MODIFY ubicacion VARCHAR(45) NULL",
         "ALTER TABLE docente MODIFY nombre_docente VARCHAR(45) NULL",
         "ALTER TABLE clase MODIFY nombre_clase VARCHAR(45) NULL",
         "ALTER TABLE alumno MODIFY nombre_alumno VARCHAR(45) NULL",
         "ALTER TABLE matricula MODIFY costo DECIMAL(10,2) NULL",
-        "ALTER TABLE pago MODIFY periodo VARCHAR(7) NULL",
-        "ALTER TABLE pago MODIFY valor_pago DECIMAL(10,2) NULL",
-        "ALTER TABLE pago MODIFY fecha DATETIME NULL",
+        "ALTER TABLE pago MODIFY periodo VARCHAR(7) NULL, MODIFY valor_pago DECIMAL(10,2) NULL, "
+        "MODIFY fecha DATETIME NULL",
         "ALTER TABLE asistencia MODIFY fecha DATETIME NULL"
     ]
     applied_alters = 0
@@ -112,151 +375,57 @@ try:
     else:
         print("No se aplicaron ALTERs (posible falta de privilegios o ya estaban).")
 
-    # ---------- Sedes ----------
-    sede_ids = []
-    common_sede_name = "Sede Principal"
-    for i in range(N):
-        if random.random() < LOW_VARIANCE_RATIO:
-            nombre = common_sede_name
-        else:
-            nombre = f"Sede {rand_text(4, 10)}"
-        ubicacion = maybe_null(f"Ciudad {random.choice(['A','B','C','D','E'])}")
-        cursor.execute("INSERT INTO sede (nombre_sede, ubicacion) VALUES (%s, %s)", (nombre, ubicacion))
-        sede_ids.append(cursor.lastrowid)
-        # commit por lotes
-        if (i + 1) % BATCH == 0:
-            conn.commit()
-    conn.commit()
-    print(f"Sedes insertadas: {len(sede_ids)}")
-
-    # ---------- Docentes ----------
-    docente_ids = []
-    common_docente = "Profesor Común"
-    nombres_base = ['Ana','Juan','Luis','Marta','Carolina','Pedro']
-    for i in range(N):
-        if random.random() < LOW_VARIANCE_RATIO:
-            nombre = common_docente
-        else:
-            nombre = f"{random.choice(nombres_base)} {random.choice(['Gómez','Pérez','López','Torres','Ruiz'])}"
-        nombre = maybe_null(nombre)
-        cursor.execute("INSERT INTO docente (nombre_docente) VALUES (%s)", (nombre,))
-        docente_ids.append(cursor.lastrowid)
-        if (i + 1) % BATCH == 0:
-            conn.commit()
-    conn.commit()
-    print(f"Docentes insertados: {len(docente_ids)}")
+    try:
+        cursor.execute(BINLOG_OFF)
+        skip_binlog = True
+        print("Binlog desactivado en las sesiones de carga (sql_log_bin=0).")
+    except Error:
+        print("Sin privilegios para sql_log_bin=0; la carga se registra en el binlog.")
 
-    # ---------- Clases (Escuela Deportiva) ----------
-    clase_ids = []
-    deportes = ["Voleibol", "Fútbol", "Baloncesto"]
-    for i in range(N):
-        if random.random() < LOW_VARIANCE_RATIO:
-            nombre_clase = random.choice(deportes)
-        else:
-            nombre_clase = rand_text(6, 18)  # Texto aleatorio, sin categorizar
-        nombre_clase = maybe_null(nombre_clase)
-        docente_id = random.choice(docente_ids)
-        cursor.execute("INSERT INTO clase (nombre_clase, docente_id) VALUES (%s, %s)", (nombre_clase, docente_id))
-        clase_ids.append(cursor.lastrowid)
-        if (i + 1) % BATCH == 0:
-            conn.commit()
-    conn.commit()
-    print(f"Clases insertadas: {len(clase_ids)}")
-
-    # ---------- Matrículas ----------
-    matricula_ids = []
-    for i in range(N):
-        if random.random() < LOW_VARIANCE_RATIO:
-            costo = Decimal('100000.00')
-        else:
-            costo = Decimal(str(round(random.uniform(50000, 300000), 2)))
-        costo = maybe_null(costo)
-        fecha_pago = random_date(365*2, 0).strftime('%Y-%m-%d %H:%M:%S')
-        cursor.execute("INSERT INTO matricula (costo, fecha_pago) VALUES (%s, %s)", (costo, fecha_pago))
-        matricula_ids.append(cursor.lastrowid)
-        if (i + 1) % BATCH == 0:
-            conn.commit()
-    conn.commit()
-    print(f"Matrículas insertadas: {len(matricula_ids)}")
-
-    # ---------- Alumnos ----------
-    alumno_ids = []
-    for i in range(N):
-        if random.random() < LOW_VARIANCE_RATIO:
-            nombre_alumno = "Estudiante Test"
-        else:
-            nombre_alumno = f"{random.choice(['Andrés','Lucía','Diego','Sofía','Camila','Miguel'])} {random.choice(['Gómez','Pérez','López','Torres'])}"
-        nombre_alumno = maybe_null(nombre_alumno)
-        matricula_id = random.choice(matricula_ids)
-        sede_id = random.choice(sede_ids)
-        cursor.execute("INSERT INTO alumno (nombre_alumno, matricula_id, sede_id) VALUES (%s, %s, %s)",
-                       (nombre_alumno, matricula_id, sede_id))
-        alumno_ids.append(cursor.lastrowid)
-        if (i + 1) % BATCH == 0:
-            conn.commit()
-    conn.commit()
-    print(f"Alumnos insertados: {len(alumno_ids)}")
-
-    # ---------- clase_has_sede ----------
-    relaciones_insertadas = 0
-    intentos = 0
-    while relaciones_insertadas < N and intentos < N * 4:  # limit para evitar loop infinito
-        intentos += 1
-        clase_id = random.choice(clase_ids)
-        sede_id = random.choice(sede_ids)
-        try:
-            cursor.execute("INSERT INTO clase_has_sede (clase_id, sede_id) VALUES (%s, %s)", (clase_id, sede_id))
-            relaciones_insertadas += 1
-            if relaciones_insertadas % BATCH == 0:
-                conn.commit()
-        except Exception:
-            pass
-    conn.commit()
-    print(f"Relaciones clase_has_sede insertadas: {relaciones_insertadas} (intentados: {intentos})")
+    # La conexión principal solo hace falta para los ALTERs y la prueba del binlog;
+    # cada tabla se carga con su propia conexión
+    cursor.close()
+    conn.close()
+    cursor = conn = None
 
-    # ---------- Pagos ----------
-    pago_count = 0
-    periods = ['2025-01','2025-02','2025-03','2025-04', '2025-05']
-    common_val = Decimal('50000.00')
-    pagos_batch = []
-    for i in range(N):
-        fecha = random_date(365, 0).strftime('%Y-%m-%d %H:%M:%S')
-        valor = common_val if random.random() < LOW_VARIANCE_RATIO else Decimal(str(round(random.uniform(20000, 150000), 2)))
-        periodo = random.choice(periods) if random.random() > 0.15 else rand_text(4,7)
-        valor = maybe_null(valor)
-        periodo = maybe_null(periodo)
-        alumno_id = random.choice(alumno_ids)
-        pagos_batch.append((fecha, valor, periodo, alumno_id))
-        if len(pagos_batch) >= BATCH:
-            cursor.executemany("INSERT INTO pago (fecha, valor_pago, periodo, alumno_id) VALUES (%s, %s, %s, %s)", pagos_batch)
-            pago_count += len(pagos_batch)
-            pagos_batch = []
-            conn.commit()
-    if pagos_batch:
-        cursor.executemany("INSERT INTO pago (fecha, valor_pago, periodo, alumno_id) VALUES (%s, %s, %s, %s)", pagos_batch)
-        pago_count += len(pagos_batch)
-        conn.commit()
-    print(f"Pagos insertados: {pago_count}")
-
-    # ---------- Asistencias ----------
-    asistencia_count = 0
-    asistencia_batch = []
-    for i in range(N):
-        fecha = random_date(90, 0).strftime('%Y-%m-%d %H:%M:%S')
-        alumno_id = random.choice(alumno_ids)
-        clase_id = random.choice(clase_ids)
-        sede_id = random.choice(sede_ids)
-        asistencia_batch.append((fecha, alumno_id, clase_id, sede_id))
-        if len(asistencia_batch) >= BATCH:
-            cursor.executemany("INSERT INTO asistencia (fecha, alumno_id, clase_id, sede_id) VALUES (%s, %s, %s, %s)", asistencia_batch)
-            asistencia_count += len(asistencia_batch)
-            asistencia_batch = []
-            conn.commit()
-    if asistencia_batch:
-        cursor.executemany("INSERT INTO asistencia (fecha, alumno_id, clase_id, sede_id) VALUES (%s, %s, %s, %s)", asistencia_batch)
-        asistencia_count += len(asistencia_batch)
-        conn.commit()
-    print(f"Asistencias insertadas: {asistencia_count}")
+    # Las tablas se cargan en paralelo por niveles según sus claves foráneas
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        # ---------- Nivel 1: sede, docente y matricula (sin dependencias) ----------
+        f_sede = ex.submit(load_table, 'sede', ('nombre_sede', 'ubicacion'),
+                           build_sede_rows(N))
+        f_docente = ex.submit(load_table, 'docente', ('nombre_docente',),
+                              build_docente_rows(N))
+        f_matricula = ex.submit(load_table, 'matricula', ('costo', 'fecha_pago'),
+                                build_matricula_rows(N))
+        sede_ids = f_sede.result()
+        print(f"Sedes insertadas: {len(sede_ids)}")
+        docente_ids = f_docente.result()
+        print(f"Docentes insertados: {len(docente_ids)}")
+        matricula_ids = f_matricula.result()
+        print(f"Matrículas insertadas: {len(matricula_ids)}")
+
+        # ---------- Nivel 2: clase (docente) y alumno (matricula, sede) ----------
+        f_clase = ex.submit(load_table, 'clase', ('nombre_clase', 'docente_id'),
+                            build_clase_rows(N, docente_ids))
+        f_alumno = ex.submit(load_table, 'alumno', ('nombre_alumno', 'matricula_id', 'sede_id'),
+                             build_alumno_rows(N, matricula_ids, sede_ids))
+        clase_ids = f_clase.result()
+        print(f"Clases insertadas: {len(clase_ids)}")
+        alumno_ids = f_alumno.result()
+        print(f"Alumnos insertados: {len(alumno_ids)}")
+
+        # ---------- Nivel 3: clase_has_sede, pago y asistencia ----------
+        f_relaciones = ex.submit(load_clase_has_sede, clase_ids, sede_ids)
+        f_pago = ex.submit(load_file, 'pago', ('fecha', 'valor_pago', 'periodo', 'alumno_id'),
+                           build_pago_rows(N, alumno_ids))
+        f_asistencia = ex.submit(load_file, 'asistencia', ('fecha', 'alumno_id', 'clase_id', 'sede_id'),
+                                 build_asistencia_rows(N, alumno_ids, clase_ids, sede_ids))
+        relaciones_insertadas = f_relaciones.result()
+        print(f"Relaciones clase_has_sede insertadas: {relaciones_insertadas}")
+        pago_count = f_pago.result()
+        print(f"Pagos insertados: {pago_count}")
+        asistencia_count = f_asistencia.result()
+        print(f"Asistencias insertadas: {asistencia_count}")
 
     # ---------- Resumen ----------
     print("\nCarga masiva finalizada. Resumen:")
@@ -275,4 +444,4 @@ finally:
     if cursor:
         cursor.close()
     if conn and conn.is_connected():
-        conn.close()
\ No newline at end of file
+        conn.close()